@@ -8,14 +8,63 @@ a complete industrial automation stack.
 """
 
 import asyncio
+import contextvars
 import json
+import logging
+import os
+import sys
 import time
 import random
 from datetime import datetime
 from typing import Dict, List, Optional, Any
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 from enum import Enum
 
+logger = logging.getLogger(__name__)
+
+# Per-flow output buffer; set while flows run concurrently so each flow's
+# lines can be flushed as one block instead of interleaving on stdout
+_flow_output: contextvars.ContextVar[Optional[List[str]]] = contextvars.ContextVar('flow_output', default=None)
+
+def _emit(text: str):
+    """Print text, or hold it in the current flow's buffer if one is active"""
+    buffer = _flow_output.get()
+    if buffer is None:
+        print(text)
+    else:
+        buffer.append(text)
+
+class FlowOutputHandler(logging.StreamHandler):
+    """Stream handler that routes records into the current flow's buffer"""
+
+    def emit(self, record: logging.LogRecord):
+        buffer = _flow_output.get()
+        if buffer is None:
+            super().emit(record)
+            return
+        try:
+            buffer.append(self.format(record))
+        except Exception:
+            self.handleError(record)
+
+# Console separators
+_BANNER_RULE = "=" * 80
+_FLOW_RULE = "=" * 60
+_MENU_RULE = "=" * 50
+_STEP_RULE = "-" * 40
+
+# PLC sensor zones and their reading keys
+_ZONES = ('A1', 'A2', 'B1', 'B2', 'C1', 'C2', 'D1', 'D2')
+_SENSOR_NAMES = tuple(f"sensor_{zone}" for zone in _ZONES)
+_ITEM_COUNTS = (0, 1, 1, 1)  # Bias towards having items
+
+# Data sources the Digital Twin synchronizes with
+_SYNC_SOURCES = ('plc_sensors', 'scada_database', 'mes_orders', 'erp_system')
+
+# Simulated MES production context options
+_PRODUCTION_STAGES = ('assembly', 'testing', 'packaging')
+_EXPECTED_LOCATIONS = ('A1', 'B2', 'C1')
+
 class ItemStatus(Enum):
     IN_PRODUCTION = "In Production"
     TESTING = "Testing"
@@ -25,7 +74,10 @@ class ItemStatus(Enum):
     PACKAGING = "Packaging"
     SHIPPING = "Shipping"
 
-@dataclass
+# Enum labels resolved once instead of on every lookup
+_STATUS_LABELS = {status: status.value for status in ItemStatus}
+
+@dataclass(slots=True)
 class Item:
     id: str
     name: str
@@ -34,14 +86,14 @@ class Item:
     last_update: datetime
     properties: Dict[str, Any]
 
-@dataclass
+@dataclass(slots=True)
 class LocationQuery:
     item_id: str
     requested_by: str
     timestamp: datetime
     priority: int = 1
 
-@dataclass
+@dataclass(slots=True)
 class LocationResponse:
     item_id: str
     location: str
@@ -58,48 +110,57 @@ class PLCController:
         self.location_requests = []
         self.items_detected = {}
         
-    async def scan_sensors(self) -> Dict[str, Any]:
+    async def scan_sensors(self, scan_time: Optional[datetime] = None) -> Dict[str, Any]:
         """Simulate sensor scanning for item detection"""
-        print(f"[PLC] 🔧 Scanning sensors at {datetime.now().strftime('%H:%M:%S')}")
+        scan_time = scan_time or datetime.now()
+        logger.info("[PLC] 🔧 Scanning sensors at %02d:%02d:%02d",
+                    scan_time.hour, scan_time.minute, scan_time.second)
         
-        # Simulate sensor readings
-        sensor_readings = {}
-        zones = ['A1', 'A2', 'B1', 'B2', 'C1', 'C2', 'D1', 'D2']
-        
-        for zone in zones:
-            # Simulate RFID/Barcode sensor readings
-            sensor_readings[f"sensor_{zone}"] = {
+        # One timestamp for the whole scan
+        last_reading = scan_time.isoformat()
+
+        # Draw RFID/Barcode readings for all zones in one batch
+        items_detected = random.choices(_ITEM_COUNTS, k=len(_ZONES))
+        uniform = random.uniform
+        signal_strengths = [uniform(85, 100) for _ in _ZONES]
+
+        sensor_readings = {
+            sensor_name: {
                 'status': 'active',
-                'items_detected': random.choice([0, 1, 1, 1]),  # Bias towards having items
-                'signal_strength': random.uniform(85, 100),
-                'last_reading': datetime.now().isoformat()
+                'items_detected': items,
+                'signal_strength': signal,
+                'last_reading': last_reading
             }
-            
+            for sensor_name, items, signal in zip(_SENSOR_NAMES, items_detected, signal_strengths)
+        }
+
         await asyncio.sleep(0.1)  # Simulate sensor processing time
         return sensor_readings
     
-    async def request_item_location(self, item_id: str, priority: int = 1) -> LocationQuery:
+    async def request_item_location(self, item_id: str, priority: int = 1,
+                                    timestamp: Optional[datetime] = None) -> LocationQuery:
         """Create a location request to be processed by SCADA"""
         query = LocationQuery(
             item_id=item_id,
             requested_by="PLC_Controller",
-            timestamp=datetime.now(),
+            timestamp=timestamp or datetime.now(),
             priority=priority
         )
         
-        print(f"[PLC] 📡 Location request generated for {item_id}")
+        logger.info("[PLC] 📡 Location request generated for %s", item_id)
         return query
     
     async def receive_location_response(self, response: LocationResponse):
         """Process location response from Digital Twin"""
-        print(f"[PLC] ✅ Location response received: {response.item_id} → Zone {response.location}")
-        print(f"[PLC] 📊 Confidence: {response.confidence:.1%}, Response time: {response.response_time_ms}ms")
+        logger.info("[PLC] ✅ Location response received: %s → Zone %s", response.item_id, response.location)
+        logger.info("[PLC] 📊 Confidence: %.1f%%, Response time: %dms",
+                    response.confidence * 100, response.response_time_ms)
         
         # Simulate PLC action based on location
         if response.confidence > 0.8:
-            print(f"[PLC] 🎯 High confidence - Directing robot to Zone {response.location}")
+            logger.info("[PLC] 🎯 High confidence - Directing robot to Zone %s", response.location)
         else:
-            print(f"[PLC] ⚠️  Low confidence - Requesting manual verification")
+            logger.info("[PLC] ⚠️  Low confidence - Requesting manual verification")
 
 class SCADASystem:
     """Handles data collection and processing from PLC"""
@@ -108,34 +169,45 @@ class SCADASystem:
         self.collected_data = {}
         self.data_buffer = []
         
-    async def collect_sensor_data(self, plc_data: Dict[str, Any]) -> Dict[str, Any]:
+    async def collect_sensor_data(self, plc_data: Dict[str, Any],
+                                  timestamp: Optional[datetime] = None) -> Dict[str, Any]:
         """Collect and process sensor data from PLC"""
-        print(f"[SCADA] 📊 Collecting data from {len(plc_data)} sensors")
-        
+        total_sensors = len(plc_data)
+        logger.info("[SCADA] 📊 Collecting data from %d sensors", total_sensors)
+
+        # Aggregate all sensor metrics in a single pass
+        active_sensors = 0
+        items_detected = 0
+        signal_sum = 0.0
+        for data in plc_data.values():
+            active_sensors += data['status'] == 'active'
+            items_detected += data['items_detected']
+            signal_sum += data['signal_strength']
+
         processed_data = {
-            'timestamp': datetime.now().isoformat(),
-            'total_sensors': len(plc_data),
-            'active_sensors': sum(1 for data in plc_data.values() if data['status'] == 'active'),
-            'items_detected': sum(data['items_detected'] for data in plc_data.values()),
-            'avg_signal_strength': sum(data['signal_strength'] for data in plc_data.values()) / len(plc_data),
+            'timestamp': (timestamp or datetime.now()).isoformat(),
+            'total_sensors': total_sensors,
+            'active_sensors': active_sensors,
+            'items_detected': items_detected,
+            'avg_signal_strength': signal_sum / total_sensors if total_sensors else 0.0,
             'raw_data': plc_data
         }
         
         self.collected_data = processed_data
         await asyncio.sleep(0.05)  # Simulate processing time
         
-        print(f"[SCADA] 📈 Data processed: {processed_data['items_detected']} items detected")
+        logger.info("[SCADA] 📈 Data processed: %d items detected", items_detected)
         return processed_data
     
     async def forward_to_mes(self, query: LocationQuery, scada_data: Dict[str, Any]) -> Dict[str, Any]:
         """Forward processed data to MES system"""
         forwarded_data = {
-            'query': asdict(query),
+            'query': query,
             'scada_analysis': scada_data,
             'data_quality': 'high' if scada_data['avg_signal_strength'] > 90 else 'medium'
         }
         
-        print(f"[SCADA] 🔄 Forwarding query for {query.item_id} to MES")
+        logger.info("[SCADA] 🔄 Forwarding query for %s to MES", query.item_id)
         return forwarded_data
 
 class MESSystem:
@@ -148,27 +220,27 @@ class MESSystem:
     async def process_location_query(self, scada_data: Dict[str, Any]) -> Dict[str, Any]:
         """Process location query with production context"""
         query = scada_data['query']
-        item_id = query['item_id']
+        item_id = query.item_id
         
-        print(f"[MES] ⚙️ Processing location query for {item_id}")
+        logger.info("[MES] ⚙️ Processing location query for %s", item_id)
         
         # Simulate production context lookup
         production_context = {
             'current_order': f"PO_{random.randint(1000, 9999)}",
-            'production_stage': random.choice(['assembly', 'testing', 'packaging']),
-            'expected_location': random.choice(['A1', 'B2', 'C1']),
-            'priority_level': query['priority']
+            'production_stage': random.choice(_PRODUCTION_STAGES),
+            'expected_location': random.choice(_EXPECTED_LOCATIONS),
+            'priority_level': query.priority
         }
         
         enhanced_query = {
             'original_query': query,
             'production_context': production_context,
             'scada_data': scada_data['scada_analysis'],
-            'mes_timestamp': datetime.now().isoformat()
+            'mes_timestamp': query.timestamp.isoformat()
         }
         
         await asyncio.sleep(0.1)  # Simulate MES processing
-        print(f"[MES] 📋 Production context added - Stage: {production_context['production_stage']}")
+        logger.info("[MES] 📋 Production context added - Stage: %s", production_context['production_stage'])
         
         return enhanced_query
 
@@ -177,24 +249,23 @@ class DigitalTwin:
     
     def __init__(self):
         self.virtual_model = {}
+        now = datetime.now()
         self.item_locations = {
-            'BATTERY_001': Item('BATTERY_001', 'Battery Unit #001', 'A1', ItemStatus.IN_PRODUCTION, datetime.now(), {}),
-            'MOTOR_A45': Item('MOTOR_A45', 'Motor Assembly A45', 'B2', ItemStatus.TESTING, datetime.now(), {}),
-            'CHASSIS_X12': Item('CHASSIS_X12', 'Chassis Frame X12', 'C1', ItemStatus.IN_STORAGE, datetime.now(), {}),
-            'CONTROL_B78': Item('CONTROL_B78', 'Control Unit B78', 'A2', ItemStatus.ASSEMBLY, datetime.now(), {}),
-            'SENSOR_S99': Item('SENSOR_S99', 'Sensor Module S99', 'D2', ItemStatus.MAINTENANCE, datetime.now(), {}),
-            'CABLE_C33': Item('CABLE_C33', 'Cable Harness C33', 'C2', ItemStatus.PACKAGING, datetime.now(), {})
+            'BATTERY_001': Item('BATTERY_001', 'Battery Unit #001', 'A1', ItemStatus.IN_PRODUCTION, now, {}),
+            'MOTOR_A45': Item('MOTOR_A45', 'Motor Assembly A45', 'B2', ItemStatus.TESTING, now, {}),
+            'CHASSIS_X12': Item('CHASSIS_X12', 'Chassis Frame X12', 'C1', ItemStatus.IN_STORAGE, now, {}),
+            'CONTROL_B78': Item('CONTROL_B78', 'Control Unit B78', 'A2', ItemStatus.ASSEMBLY, now, {}),
+            'SENSOR_S99': Item('SENSOR_S99', 'Sensor Module S99', 'D2', ItemStatus.MAINTENANCE, now, {}),
+            'CABLE_C33': Item('CABLE_C33', 'Cable Harness C33', 'C2', ItemStatus.PACKAGING, now, {})
         }
         
     async def synchronize_with_physical(self, mes_data: Dict[str, Any]) -> bool:
         """Synchronize digital model with physical factory state"""
-        print(f"[DIGITAL TWIN] 🌐 Synchronizing virtual model with physical factory")
+        logger.info("[DIGITAL TWIN] 🌐 Synchronizing virtual model with physical factory")
         
         # Simulate synchronization with various data sources
-        sync_sources = ['plc_sensors', 'scada_database', 'mes_orders', 'erp_system']
-        
-        for source in sync_sources:
-            print(f"[DIGITAL TWIN] 🔄 Syncing with {source}...")
+        for source in _SYNC_SOURCES:
+            logger.info("[DIGITAL TWIN] 🔄 Syncing with %s...", source)
             await asyncio.sleep(0.02)
         
         # Update virtual model
@@ -205,22 +276,22 @@ class DigitalTwin:
             'model_accuracy': random.uniform(98, 99.8)
         }
         
-        print(f"[DIGITAL TWIN] ✅ Sync complete - Accuracy: {self.virtual_model['model_accuracy']:.1f}%")
+        logger.info("[DIGITAL TWIN] ✅ Sync complete - Accuracy: %.1f%%", self.virtual_model['model_accuracy'])
         return True
     
     async def locate_item(self, mes_query: Dict[str, Any]) -> LocationResponse:
         """Find item location using digital twin model"""
         query = mes_query['original_query']
-        item_id = query['item_id']
+        item_id = query.item_id
         
-        start_time = time.time()
-        print(f"[DIGITAL TWIN] 🔍 Searching for {item_id} in virtual model")
+        start_ns = time.perf_counter_ns()
+        logger.info("[DIGITAL TWIN] 🔍 Searching for %s in virtual model", item_id)
         
         # Simulate AI-powered location search
         await asyncio.sleep(0.15)  # Simulate complex search algorithms
         
-        if item_id in self.item_locations:
-            item = self.item_locations[item_id]
+        item = self.item_locations.get(item_id)
+        if item is not None:
             confidence = random.uniform(85, 99) / 100
             
             # Update item last seen
@@ -229,14 +300,14 @@ class DigitalTwin:
             response = LocationResponse(
                 item_id=item_id,
                 location=item.location,
-                status=item.status.value,
+                status=_STATUS_LABELS[item.status],
                 confidence=confidence,
-                response_time_ms=int((time.time() - start_time) * 1000),
+                response_time_ms=(time.perf_counter_ns() - start_ns) // 1_000_000,
                 digital_twin_verified=True
             )
             
-            print(f"[DIGITAL TWIN] 🎯 Item found: {item.name} at Zone {item.location}")
-            print(f"[DIGITAL TWIN] 📊 Status: {item.status.value}, Confidence: {confidence:.1%}")
+            logger.info("[DIGITAL TWIN] 🎯 Item found: %s at Zone %s", item.name, item.location)
+            logger.info("[DIGITAL TWIN] 📊 Status: %s, Confidence: %.1f%%", _STATUS_LABELS[item.status], confidence * 100)
             
         else:
             response = LocationResponse(
@@ -244,11 +315,11 @@ class DigitalTwin:
                 location="UNKNOWN",
                 status="NOT_FOUND",
                 confidence=0.0,
-                response_time_ms=int((time.time() - start_time) * 1000),
+                response_time_ms=(time.perf_counter_ns() - start_ns) // 1_000_000,
                 digital_twin_verified=False
             )
             
-            print(f"[DIGITAL TWIN] ❌ Item {item_id} not found in virtual model")
+            logger.info("[DIGITAL TWIN] ❌ Item %s not found in virtual model", item_id)
         
         return response
 
@@ -263,78 +334,139 @@ class ItemTrackingOrchestrator:
         
     async def track_item_location(self, item_id: str) -> LocationResponse:
         """Execute complete item tracking flow"""
-        print(f"\n{'='*60}")
-        print(f"🎯 STARTING ITEM TRACKING FLOW FOR: {item_id}")
-        print(f"{'='*60}")
+        # Single clock sample shared by every stage of this flow
+        flow_ts = datetime.now()
+
+        _emit(f"\n{_FLOW_RULE}\n"
+              f"🎯 STARTING ITEM TRACKING FLOW FOR: {item_id}\n"
+              f"{_FLOW_RULE}")
         
         try:
             # Step 1: PLC generates location request
-            print(f"\n📍 STEP 1: PLC REQUEST GENERATION")
-            print("-" * 40)
-            query = await self.plc.request_item_location(item_id)
+            _emit(f"\n📍 STEP 1: PLC REQUEST GENERATION\n{_STEP_RULE}")
+            query = await self.plc.request_item_location(item_id, timestamp=flow_ts)
             
             # Step 2: PLC scans sensors
-            print(f"\n🔧 STEP 2: PLC SENSOR SCANNING")
-            print("-" * 40)
-            sensor_data = await self.plc.scan_sensors()
+            _emit(f"\n🔧 STEP 2: PLC SENSOR SCANNING\n{_STEP_RULE}")
+            sensor_data = await self.plc.scan_sensors(flow_ts)
             
             # Step 3: SCADA collects and processes data
-            print(f"\n📊 STEP 3: SCADA DATA PROCESSING")
-            print("-" * 40)
-            scada_processed = await self.scada.collect_sensor_data(sensor_data)
+            _emit(f"\n📊 STEP 3: SCADA DATA PROCESSING\n{_STEP_RULE}")
+            scada_processed = await self.scada.collect_sensor_data(sensor_data, flow_ts)
             forwarded_data = await self.scada.forward_to_mes(query, scada_processed)
             
             # Step 4: MES adds production context
-            print(f"\n⚙️ STEP 4: MES PRODUCTION CONTEXT")
-            print("-" * 40)
+            _emit(f"\n⚙️ STEP 4: MES PRODUCTION CONTEXT\n{_STEP_RULE}")
             mes_enhanced = await self.mes.process_location_query(forwarded_data)
             
             # Step 5: Digital Twin synchronization and search
-            print(f"\n🌐 STEP 5: DIGITAL TWIN PROCESSING")
-            print("-" * 40)
+            _emit(f"\n🌐 STEP 5: DIGITAL TWIN PROCESSING\n{_STEP_RULE}")
             await self.digital_twin.synchronize_with_physical(mes_enhanced)
             location_response = await self.digital_twin.locate_item(mes_enhanced)
             
             # Step 6: PLC receives response
-            print(f"\n🔄 STEP 6: PLC RESPONSE PROCESSING")
-            print("-" * 40)
+            _emit(f"\n🔄 STEP 6: PLC RESPONSE PROCESSING\n{_STEP_RULE}")
             await self.plc.receive_location_response(location_response)
             
-            print(f"\n{'='*60}")
-            print(f"✅ TRACKING FLOW COMPLETED FOR: {item_id}")
-            print(f"📍 RESULT: Zone {location_response.location} ({location_response.confidence:.1%} confidence)")
-            print(f"⏱️  TOTAL TIME: {location_response.response_time_ms}ms")
-            print(f"{'='*60}\n")
+            _emit(f"\n{_FLOW_RULE}\n"
+                  f"✅ TRACKING FLOW COMPLETED FOR: {item_id}\n"
+                  f"📍 RESULT: Zone {location_response.location} ({location_response.confidence:.1%} confidence)\n"
+                  f"⏱️  TOTAL TIME: {location_response.response_time_ms}ms\n"
+                  f"{_FLOW_RULE}\n")
             
             return location_response
             
         except Exception as e:
-            print(f"❌ Error in tracking flow: {e}")
+            logger.error("❌ Error in tracking flow: %s", e)
             raise
 
+    async def _track_buffered(self, item_id: str) -> LocationResponse:
+        """Track an item, holding its output until the flow completes"""
+        # gather runs each coroutine in its own Task with a copied context,
+        # so this buffer is only visible to this flow
+        buffer = []
+        _flow_output.set(buffer)
+        try:
+            return await self.track_item_location(item_id)
+        finally:
+            _flow_output.set(None)
+            print("\n".join(buffer))
+
     async def demonstrate_system(self):
         """Run a complete system demonstration"""
-        print("🏭 SMART ITEM TRACKING SYSTEM DEMONSTRATION")
-        print("=" * 80)
-        print("System Architecture: PLC → SCADA → MES → Digital Twin → PLC")
-        print("=" * 80)
+        print("🏭 SMART ITEM TRACKING SYSTEM DEMONSTRATION\n"
+              f"{_BANNER_RULE}\n"
+              "System Architecture: PLC → SCADA → MES → Digital Twin → PLC\n"
+              f"{_BANNER_RULE}")
         
         # Available items to track
         items_to_track = ['BATTERY_001', 'MOTOR_A45', 'CHASSIS_X12', 'CONTROL_B78']
         
-        for i, item_id in enumerate(items_to_track, 1):
-            print(f"\n🎬 DEMONSTRATION {i}/{len(items_to_track)}")
-            await self.track_item_location(item_id)
-            
-            if i < len(items_to_track):
-                print("⏳ Waiting before next demonstration...")
-                await asyncio.sleep(2)
-        
-        print("\n🎉 SYSTEM DEMONSTRATION COMPLETED!")
-        print("All items successfully tracked through the complete automation stack.")
+        # Track all items concurrently; each flow's output is buffered and
+        # printed as one block when that flow finishes
+        print(f"\n🎬 DEMONSTRATION: tracking {len(items_to_track)} items concurrently")
+        results = await asyncio.gather(
+            *(self._track_buffered(item_id) for item_id in items_to_track)
+        )
+
+        summary = "\n".join(
+            f"  • {response.item_id}: Zone {response.location} ({response.confidence:.1%} confidence)"
+            for response in results
+        )
+        print(f"\n📋 DEMONSTRATION RESULTS\n{summary}\n"
+              "\n🎉 SYSTEM DEMONSTRATION COMPLETED!\n"
+              "All items successfully tracked through the complete automation stack.")
+
+# Bytes read from stdin past the last returned line
+_stdin_pending = bytearray()
+
+async def read_input(prompt: str) -> str:
+    """Read a line from stdin without blocking the event loop"""
+    loop = asyncio.get_running_loop()
+    fd = sys.stdin.fileno()
+    print(prompt, end="", flush=True)
+
+    future = loop.create_future()
+
+    def on_readable():
+        if future.done():
+            return  # Already resolved; reader is about to be removed
+        chunk = os.read(fd, 4096)
+        if not chunk:
+            if not _stdin_pending:
+                future.set_exception(EOFError("EOF when reading a line"))
+                return
+            chunk = b"\n"  # Unterminated last line
+        _stdin_pending.extend(chunk)
+        if b"\n" in _stdin_pending:
+            future.set_result(None)
+
+    while b"\n" not in _stdin_pending:
+        try:
+            loop.add_reader(fd, on_readable)
+        except (NotImplementedError, PermissionError):
+            # Proactor loop (Windows) or a regular file on stdin; no
+            # readiness polling, so read on the default executor
+            line = await loop.run_in_executor(None, sys.stdin.readline)
+            if not line:
+                raise EOFError("EOF when reading a line")
+            return line.rstrip("\n")
+        try:
+            await future
+        finally:
+            loop.remove_reader(fd)
+        future = loop.create_future()
+
+    line, _, rest = bytes(_stdin_pending).partition(b"\n")
+    _stdin_pending[:] = rest
+    return line.decode(sys.stdin.encoding or "utf-8", errors="replace")
 
 async def main():
     """Main entry point"""
+    # Component telemetry goes through logging; show it as plain console lines
+    handler = FlowOutputHandler(sys.stdout)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    logging.basicConfig(level=logging.INFO, handlers=[handler])
     print("🚀 Initializing Smart Item Tracking System...")
     
     orchestrator = ItemTrackingOrchestrator()
@@ -343,30 +475,27 @@ async def main():
         await orchestrator.demonstrate_system()
         
         # Interactive mode
-        print("\n" + "="*50)
-        print("🎮 INTERACTIVE MODE")
-        print("="*50)
+        print(f"\n{_MENU_RULE}\n🎮 INTERACTIVE MODE\n{_MENU_RULE}")
         
         while True:
-            print("\nAvailable items:")
             items = list(orchestrator.digital_twin.item_locations.keys())
-            for i, item in enumerate(items, 1):
-                print(f"{i}. {item}")
-            
-            print("\nCommands:")
-            print("- Enter item number (1-6) to track")
-            print("- 'status' to show system status")
-            print("- 'quit' to exit")
+            item_menu = "\n".join(f"{i}. {item}" for i, item in enumerate(items, 1))
+            print(f"\nAvailable items:\n{item_menu}\n"
+                  "\nCommands:\n"
+                  "- Enter item number (1-6) to track\n"
+                  "- 'status' to show system status\n"
+                  "- 'quit' to exit")
             
-            user_input = input("\n🎯 Enter command: ").strip().lower()
+            user_input = (await read_input("\n🎯 Enter command: ")).strip().lower()
             
             if user_input == 'quit':
                 break
             elif user_input == 'status':
-                print(f"\n📊 System Status:")
-                print(f"  • Items tracked: {len(orchestrator.digital_twin.item_locations)}")
-                print(f"  • Digital Twin accuracy: {orchestrator.digital_twin.virtual_model.get('model_accuracy', 'Unknown'):.1f}%")
-                print(f"  • Last sync: {orchestrator.digital_twin.virtual_model.get('last_sync', 'Never')}")
+                virtual_model = orchestrator.digital_twin.virtual_model
+                print("\n📊 System Status:\n"
+                      f"  • Items tracked: {len(orchestrator.digital_twin.item_locations)}\n"
+                      f"  • Digital Twin accuracy: {virtual_model.get('model_accuracy', 'Unknown'):.1f}%\n"
+                      f"  • Last sync: {virtual_model.get('last_sync', 'Never')}")
             elif user_input.isdigit():
                 try:
                     item_index = int(user_input) - 1
@@ -380,7 +509,7 @@ async def main():
             else:
                 print("❌ Unknown command")
                 
-    except KeyboardInterrupt:
+    except (KeyboardInterrupt, asyncio.CancelledError):
         print("\n\n🛑 System shutdown requested by user")
     except Exception as e:
         print(f"\n❌ System error: {e}")
@@ -388,4 +517,21 @@ async def main():
         print("👋 Smart Item Tracking System terminated")
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    # Prefer the libuv-based loop when available; fall back to the stdlib loop
+    # (e.g. on Windows, where uvloop is not supported)
+    try:
+        import uvloop
+    except ImportError:
+        run = asyncio.run
+    else:
+        if hasattr(uvloop, "run"):  # uvloop >= 0.18
+            run = uvloop.run
+        else:
+            uvloop.install()
+            run = asyncio.run
+    try:
+        run(main())
+    except KeyboardInterrupt:
+        # Before Python 3.11 Ctrl-C escapes the loop instead of cancelling
+        # main(); its shutdown path has already run during loop cleanup
+        pass